@@ -9,28 +9,81 @@ Suporta versionamento:
 - filename: adiciona sufixo _backup_<timestamp> no nome de cada arquivo
 
 Também possui tratamento de exceções para cenários comuns (origem inexistente etc.).
+
+Desempenho:
+- A cópia usa os.sendfile em blocos de 1 MiB (SENDFILE_CHUNK_SIZE), ou 4 MiB
+  para arquivos grandes (LARGE_FILE_CHUNK_SIZE).
+- copy_mode="reflink" clona o arquivo (FICLONE, btrfs/XFS) e "hardlink" cria
+  links físicos; ambos só valem quando origem e destino estão no mesmo
+  sistema de arquivos e completam em O(1) independente do tamanho.
+- Incremental: arquivos com mesmo tamanho+mtime não são copiados de novo
+  (versioning="none"), ou viram links físicos para um backup anterior
+  (versioning="folder" com link_unchanged).
+- Com jobs > 1, arquivos pequenos e grandes seguem filas separadas: muitas
+  threads para os pequenos (em lotes) e poucas para os grandes, para que um
+  arquivo enorme não atrase milhares de pequenos.
+- Ao importar o módulo, shutil.COPY_BUFSIZE é elevado para no mínimo 256 KiB
+  (valor padrão a partir do Python 3.13), acelerando o fallback via shutil.copyfile
+  em versões mais antigas.
+- O módulo é todo anotado e compilável com mypyc (`mypyc app/backup.py`); a
+  imagem Docker já o compila. Sem compilador C, o Python puro é usado.
 """
 
 from __future__ import annotations
 
+import errno
+import fcntl
+import itertools
 import logging
+import os
+import queue
 import shutil
-from dataclasses import dataclass
+import threading
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Literal
+from typing import Callable, Iterable, Iterator, Literal, Sequence
 
 
 VersioningMode = Literal["none", "folder", "filename"]
+CopyMode = Literal["copy", "reflink", "hardlink"]
+
+# Tamanho de cada chamada ao os.sendfile
+SENDFILE_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Arquivos grandes usam blocos maiores (menos syscalls por arquivo)
+LARGE_FILE_CHUNK_SIZE = 4 << 20  # 4 MiB
+# A partir deste tamanho o arquivo vai para a fila de arquivos grandes
+LARGE_FILE_THRESHOLD = 1 << 20  # 1 MiB
+# Arquivos pequenos são enfileirados em lotes
+SMALL_FILE_BATCH_SIZE = 64
+# ioctl do Linux para clonar (reflink/COW) um arquivo inteiro: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+# Erros que indicam "reflink não suportado aqui" (cai para cópia normal)
+_REFLINK_UNSUPPORTED = frozenset(
+    (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS)
+)
+
+# Intervalo (em arquivos) entre linhas de progresso no nível INFO
+PROGRESS_LOG_EVERY = 10_000
+
+# Buffer do fallback do shutil (64 KiB no POSIX antes do Python 3.13)
+shutil.COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, 256 * 1024)  # type: ignore[attr-defined]
 
 
 @dataclass(frozen=True)
 class BackupResult:
-    """Resultado do backup."""
+    """
+    Resultado do backup.
+
+    bytes_copied soma os tamanhos vistos na travessia dos arquivos copiados,
+    com qualquer valor de jobs.
+    """
     files_copied: int
     bytes_copied: int
     destination_used: Path
     timestamp_str: str
+    files_unchanged: int = 0
 
 
 def _timestamp_str(now: datetime | None = None) -> str:
@@ -57,27 +110,380 @@ def _compute_destination_root(dest: Path, versioning: VersioningMode, ts: str) -
     return dest
 
 
-def _destination_for_file(
-    dest_root: Path,
-    rel_path: Path,
-    versioning: VersioningMode,
-    ts: str,
-) -> Path:
+def _plain_target(dest_prefix: str, rel: str) -> str:
+    """
+    Destino para versioning="none" e "folder": mesmo caminho relativo, mesmo nome.
+
+    dest_prefix é a raiz de destino já terminada em separador (em "folder" ela
+    já inclui a subpasta <ts>).
+    """
+    return f"{dest_prefix}{rel}"
+
+
+def _filename_target_factory(ts: str) -> Callable[[str, str], str]:
+    """
+    Retorna o montador de destino para versioning="filename", que adiciona
+    _backup_<ts> antes da extensão. O sufixo é formatado uma única vez.
+    """
+    name_suffix = f"_backup_{ts}"
+
+    def _filename_target(dest_prefix: str, rel: str) -> str:
+        # splitext só considera o último componente, então subpastas são preservadas
+        root, ext = os.path.splitext(rel)
+        return f"{dest_prefix}{root}{name_suffix}{ext}"
+
+    return _filename_target
+
+
+def _default_jobs() -> int:
+    """
+    Número padrão de threads de cópia quando jobs=0 (automático).
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _split_workers(workers: int) -> tuple[int, int]:
+    """
+    Divide as threads entre a fila de arquivos pequenos e a de grandes
+    (aprox. 4:1, ex.: 20 -> 16 + 4), com ao menos uma thread em cada.
+
+    Returns:
+        (threads_pequenos, threads_grandes)
+    """
+    large = max(1, workers // 5)
+    small = max(1, workers - large)
+    return small, large
+
+
+def _prefix_len(root: str) -> int:
+    """
+    Tamanho do prefixo a cortar dos caminhos gerados por os.scandir(root) para
+    obter o caminho relativo: root mais um separador, exceto quando root já
+    termina em separador (ex.: "/").
+    """
+    return len(os.path.join(root, ""))
+
+
+def _walk_files(
+    root: str,
+    on_dir: Callable[[str], None] | None = None,
+) -> Iterator[tuple[str, int, int]]:
+    """
+    Percorre root recursivamente com os.scandir (sem criar Path por entrada).
+
+    Links simbólicos para diretórios não são seguidos.
+
+    is_dir/is_file usam o d_type devolvido pelo próprio scandir (sem syscall,
+    exceto em sistemas de arquivos que não o preenchem). No Linux entry.stat()
+    faz um stat() por arquivo: o scandir do POSIX não traz metadados além do
+    d_type. Tamanho e mtime obtidos aqui decidem a fila, o incremental e o
+    total de bytes; a cópia ainda faz fstat() da origem (_open_destination) e
+    shutil.copystat() faz stat() dela.
+
+    Args:
+        on_dir: Chamada com o caminho de cada subdiretório assim que ele é
+                encontrado, sempre antes de qualquer arquivo dentro dele ser
+                gerado (e depois do diretório pai).
+
+    Yields:
+        Tuplas (caminho_completo, tamanho_em_bytes, mtime_em_segundos) para cada arquivo.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if on_dir is not None:
+                        on_dir(entry.path)
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    st = entry.stat()
+                    yield entry.path, st.st_size, int(st.st_mtime)
+
+
+def _is_unchanged(path: str, size: int, mtime: int) -> bool:
+    """
+    Indica se path existe com o mesmo tamanho e mtime (em segundos) da origem.
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return st.st_size == size and int(st.st_mtime) == mtime
+
+
+@dataclass(frozen=True)
+class _Lane:
+    """Fila de cópia com seu próprio conjunto de threads."""
+    name: str
+    workers: int
+    batch_size: int = 1
+
+
+@dataclass
+class _JobBatch:
     """
-    Gera o caminho destino para um arquivo individual, preservando subpastas.
+    Lote de arquivos em estrutura de arrays (SoA): colunas paralelas indexadas
+    por inteiro, em vez de uma tupla/objeto por arquivo. Tamanhos e mtimes
+    ficam em array.array("q") (inteiros de 64 bits contíguos, sem objetos).
+    """
+    paths: list[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array("q"))
+    mtimes: array = field(default_factory=lambda: array("q"))
+
+    def append(self, path: str, size: int, mtime: int) -> None:
+        self.paths.append(path)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def _copy_pipeline(
+    files: Iterable[tuple[str, int, int]],
+    copy_fn: Callable[[str, int, int], int | None],
+    lanes: Sequence[_Lane],
+    route: Callable[[int], int],
+    maxsize: int = 1024,
+) -> tuple[int, int, int]:
+    """
+    Produtor/consumidor: uma thread percorre files (caminho, tamanho, mtime) e
+    distribui cada arquivo, via route(tamanho) (índice em lanes), para a fila
+    limitada da lane correspondente. Cada lane tem `workers` threads que
+    consomem e chamam copy_fn(caminho, tamanho, mtime), que retorna None quando
+    o arquivo não mudou e não foi copiado. Os bytes copiados são a soma dos
+    tamanhos vistos na travessia (sum() sobre o array.array de cada lote).
+
+    A travessia acontece em paralelo com as cópias, então a primeira cópia
+    começa sem esperar a listagem completa e a memória fica limitada a maxsize
+    lotes por lane. Cada lote (_JobBatch) tem até batch_size arquivos,
+    reduzindo o custo da fila para arquivos pequenos.
+
+    Returns:
+        (arquivos_copiados, bytes_copiados, arquivos_inalterados)
+
+    Raises:
+        A primeira exceção lançada pela travessia ou por uma cópia.
+    """
+    queues: list[queue.Queue[_JobBatch | None]] = [queue.Queue(maxsize=maxsize) for _ in lanes]
+    errors: list[BaseException] = []
+    failed = threading.Event()
+    totals: list[tuple[int, int, int]] = []
+    lock = threading.Lock()
+
+    def producer() -> None:
+        batches = [_JobBatch() for _ in lanes]
+        try:
+            for path, size, mtime in files:
+                if failed.is_set():
+                    break
+                idx = route(size)
+                batch = batches[idx]
+                batch.append(path, size, mtime)
+                if len(batch) >= lanes[idx].batch_size:
+                    queues[idx].put(batch)
+                    batches[idx] = _JobBatch()
+            for idx, batch in enumerate(batches):
+                if batch:
+                    queues[idx].put(batch)
+        except BaseException as exc:
+            errors.append(exc)
+            failed.set()
+        finally:
+            # None é o sentinela de fim para cada thread
+            for lane, q in zip(lanes, queues):
+                for _ in range(lane.workers):
+                    q.put(None)
+
+    def consumer(q: queue.Queue[_JobBatch | None]) -> None:
+        files_done = 0
+        nbytes = 0
+        unchanged = 0
+        while True:
+            batch = q.get()
+            if batch is None:
+                break
+            # Após uma falha, só drena a fila para o produtor não bloquear
+            if failed.is_set():
+                continue
+            paths, sizes, mtimes = batch.paths, batch.sizes, batch.mtimes
+            batch_unchanged = 0
+            unchanged_bytes = 0
+            try:
+                for i in range(len(paths)):
+                    if copy_fn(paths[i], sizes[i], mtimes[i]) is None:
+                        batch_unchanged += 1
+                        unchanged_bytes += sizes[i]
+            except BaseException as exc:
+                errors.append(exc)
+                failed.set()
+                continue
+            # Bytes somados uma vez por lote, em C, sobre o array de tamanhos
+            files_done += len(paths) - batch_unchanged
+            nbytes += sum(sizes) - unchanged_bytes
+            unchanged += batch_unchanged
+        with lock:
+            totals.append((files_done, nbytes, unchanged))
+
+    threads = [threading.Thread(target=producer, name="backup-walk", daemon=True)]
+    for lane, q in zip(lanes, queues):
+        threads += [
+            threading.Thread(target=consumer, args=(q,), name=f"backup-{lane.name}-{i}", daemon=True)
+            for i in range(lane.workers)
+        ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
+    return (
+        sum(t[0] for t in totals),
+        sum(t[1] for t in totals),
+        sum(t[2] for t in totals),
+    )
+
+
+def _open_destination(src_fd: int, src: str | Path, dst: str | Path) -> int:
+    """
+    Abre dst para escrita, sem truncar antes de comparar com a origem.
 
-    - none/folder: mantém o nome do arquivo.
-    - filename: adiciona _backup_<ts> antes da extensão.
+    Se dst já existe como link físico (st_nlink > 1, ex.: criado por
+    copy_mode="hardlink" ou link_unchanged), ele é removido e recriado: escrever
+    no lugar alteraria também a origem ou o backup anterior ligados a ele.
+
+    Raises:
+        shutil.SameFileError: Se dst for a própria origem (mesmo caminho);
+                              nesse caso nada é alterado.
+    """
+    dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o666)
+    try:
+        src_st = os.fstat(src_fd)
+        dst_st = os.fstat(dst_fd)
+        same_inode = (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino)
+        if same_inode and (
+            dst_st.st_nlink == 1 or os.path.realpath(src) == os.path.realpath(dst)
+        ):
+            raise shutil.SameFileError(f"{src!r} e {dst!r} são o mesmo arquivo")
+        if dst_st.st_nlink > 1:
+            os.close(dst_fd)
+            dst_fd = -1
+            os.unlink(dst)
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        else:
+            os.ftruncate(dst_fd, 0)
+    except BaseException:
+        if dst_fd >= 0:
+            os.close(dst_fd)
+        raise
+    return dst_fd
+
+
+def _copy_file_fast(
+    src: str | Path,
+    dst: str | Path,
+    chunk_size: int = SENDFILE_CHUNK_SIZE,
+) -> int:
     """
-    if versioning != "filename":
-        return dest_root / rel_path
+    Copia um arquivo usando os.sendfile (zero-copy, dados ficam no kernel).
+
+    Se o sendfile não for suportado (EINVAL/ENOSYS), cai para shutil.copyfile.
+    Ao final copia os metadados (permissões, mtime) com shutil.copystat.
 
-    # rel_path pode conter subpastas, então precisamos tratar só o nome
-    parent = rel_path.parent
-    stem = rel_path.stem
-    suffix = rel_path.suffix  # inclui o ponto (ex: .txt)
-    new_name = f"{stem}_backup_{ts}{suffix}"
-    return dest_root / parent / new_name
+    Raises:
+        shutil.SameFileError: Se src e dst forem o mesmo arquivo (como shutil.copy2).
+
+    Args:
+        chunk_size: Bytes por chamada ao os.sendfile.
+
+    Returns:
+        Quantidade de bytes copiados.
+    """
+    copied = 0
+    use_fallback = False
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = _open_destination(src_fd, src, dst)
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, None, chunk_size)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError as exc:
+            if exc.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            # Tamanho vem do fd já aberto: nada de stat() no destino após a cópia
+            use_fallback = True
+            copied = os.fstat(src_fd).st_size
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if use_fallback:
+        # Fallback: sendfile indisponível para este par de arquivos
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+    return copied
+
+
+def _reflink_file(src: str | Path, dst: str | Path) -> bool:
+    """
+    Clona src em dst via ioctl FICLONE (copy-on-write, sem copiar dados).
+
+    Raises:
+        shutil.SameFileError: Se src e dst forem o mesmo arquivo.
+
+    Returns:
+        True se clonou (metadados já copiados); False se o sistema de arquivos
+        não suporta reflink, caso em que o chamador deve copiar normalmente.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = _open_destination(src_fd, src, dst)
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        except OSError as exc:
+            if exc.errno not in _REFLINK_UNSUPPORTED:
+                raise
+            cloned = False
+        else:
+            cloned = True
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if cloned:
+        shutil.copystat(src, dst)
+    return cloned
+
+
+def _link_file(src: str | Path, dst: str | Path) -> None:
+    """
+    Cria dst como link físico para src (substitui dst se já existir).
+
+    Se dst já é um link para o mesmo inode, nada é feito.
+
+    Raises:
+        shutil.SameFileError: Se dst for o próprio caminho de src; nada é removido.
+    """
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        src_st = os.stat(src)
+        dst_st = os.stat(dst)
+        if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+            if os.path.realpath(src) == os.path.realpath(dst):
+                raise shutil.SameFileError(f"{src!r} e {dst!r} são o mesmo arquivo") from None
+            return
+        os.unlink(dst)
+        os.link(src, dst)
 
 
 def run_backup(
@@ -87,6 +493,11 @@ def run_backup(
     create_destination: bool = True,
     logger: logging.Logger | None = None,
     now_fn: Callable[[], datetime] | None = None,
+    jobs: int = 1,
+    large_file_threshold: int = LARGE_FILE_THRESHOLD,
+    copy_mode: CopyMode = "copy",
+    skip_unchanged: bool = True,
+    link_unchanged: str | Path | None = None,
 ) -> BackupResult:
     """
     Executa o backup copiando arquivos de source_dir para destination_dir.
@@ -99,6 +510,18 @@ def run_backup(
                             Se False, falha caso destino não exista.
         logger: Logger opcional.
         now_fn: Função opcional para fornecer datetime (útil em testes).
+        jobs: Quantidade de threads de cópia. 1 copia sequencialmente;
+              0 escolhe automaticamente (min(32, cpu_count * 4)).
+        large_file_threshold: Tamanho (bytes) a partir do qual um arquivo é
+                              tratado como grande (fila própria, blocos de 4 MiB).
+        copy_mode: "copy" | "reflink" | "hardlink". reflink/hardlink exigem
+                   origem e destino no mesmo sistema de arquivos; caso
+                   contrário o backup usa "copy" (com aviso no log).
+        skip_unchanged: Com versioning="none", não copia arquivos cujo destino
+                        já tem o mesmo tamanho e mtime (backup incremental).
+        link_unchanged: Com versioning="folder", raiz de um backup anterior.
+                        Arquivos inalterados em relação a ele viram links
+                        físicos para a cópia anterior (como rsync --link-dest).
 
     Returns:
         BackupResult
@@ -106,10 +529,20 @@ def run_backup(
     Raises:
         FileNotFoundError: Se origem não existir ou destino não existir (quando create_destination=False).
         NotADirectoryError: Se source_dir não for diretório.
-        ValueError: Se versioning inválido.
+        ValueError: Se versioning, jobs, large_file_threshold ou copy_mode inválido,
+                    ou link_unchanged usado fora de versioning="folder".
     """
     if versioning not in ("none", "folder", "filename"):
         raise ValueError(f"versioning inválido: {versioning}")
+    if copy_mode not in ("copy", "reflink", "hardlink"):
+        raise ValueError(f"copy_mode inválido: {copy_mode}")
+    if link_unchanged is not None and versioning != "folder":
+        raise ValueError("link_unchanged só é suportado com versioning='folder'")
+    if jobs < 0:
+        raise ValueError(f"jobs inválido: {jobs}")
+    if large_file_threshold < 0:
+        raise ValueError(f"large_file_threshold inválido: {large_file_threshold}")
+    workers = jobs or _default_jobs()
 
     log = logger or logging.getLogger("backup_tool")
     src = Path(source_dir)
@@ -138,38 +571,145 @@ def run_backup(
         _ensure_dir_exists(dest_root)
         log.info("Diretório de backup (versionado) criado: %s", dest_root)
 
-    files_copied = 0
-    bytes_copied = 0
-
-    # Caminha recursivamente
-    for path in src.rglob("*"):
-        if path.is_dir():
-            continue
-        rel = path.relative_to(src)
-        target = _destination_for_file(dest_root, rel, versioning, ts)
-
-        # Garante subpastas
-        target.parent.mkdir(parents=True, exist_ok=True)
-
-        # Copia (preserva metadata básica com copy2)
-        shutil.copy2(path, target)
-
-        size = target.stat().st_size
-        files_copied += 1
-        bytes_copied += size
-
-        log.info("Arquivo copiado: %s -> %s (%d bytes)", path, target, size)
+    src_str = os.fspath(src)
+    prefix_len = _prefix_len(src_str)
+
+    dest_root_str = os.fspath(dest_root)
+
+    # Versionamento é fixo durante o backup: escolhe o montador de destino uma vez
+    dest_prefix = os.path.join(dest_root_str, "")
+    mk_target: Callable[[str, str], str]
+    if versioning == "filename":
+        mk_target = _filename_target_factory(ts)
+    else:
+        mk_target = _plain_target
+
+    # reflink/hardlink só funcionam dentro do mesmo sistema de arquivos: checa uma vez
+    if copy_mode != "copy" and os.stat(src_str).st_dev != os.stat(dest_root_str).st_dev:
+        log.warning(
+            "Origem e destino em sistemas de arquivos diferentes; copy_mode=%s ignorado, usando copy",
+            copy_mode,
+        )
+        copy_mode = "copy"
+
+    if copy_mode == "hardlink":
+        def transfer(path: str, target: str, src_size: int) -> int:
+            _link_file(path, target)
+            return src_size
+    else:
+        use_reflink = copy_mode == "reflink"
+
+        def transfer(path: str, target: str, src_size: int) -> int:
+            # Tamanho vem da travessia, sem consultar a origem de novo para isso
+            if use_reflink and _reflink_file(path, target):
+                return src_size
+            chunk = LARGE_FILE_CHUNK_SIZE if src_size >= large_file_threshold else SENDFILE_CHUNK_SIZE
+            return _copy_file_fast(path, target, chunk)
+
+    # Incremental: compara tamanho+mtime com o destino (none) ou com o backup anterior (folder)
+    check_target = skip_unchanged and versioning == "none"
+    link_prefix: str | None = None
+    if link_unchanged is not None:
+        link_root = os.fspath(link_unchanged)
+        if not os.path.isdir(link_root):
+            log.warning("Backup anterior não encontrado, link_unchanged ignorado: %s", link_root)
+        elif os.stat(link_root).st_dev != os.stat(dest_root_str).st_dev:
+            log.warning(
+                "Backup anterior em outro sistema de arquivos, link_unchanged ignorado: %s",
+                link_root,
+            )
+        elif os.path.samefile(link_root, dest_root_str):
+            # Ex.: duas execuções no mesmo segundo reutilizam a pasta <ts>
+            log.warning("Backup anterior é o próprio destino, link_unchanged ignorado: %s", link_root)
+        else:
+            link_prefix = os.path.join(link_root, "")
+
+    # Níveis checados uma vez: evita despachar/formatar um registro por arquivo.
+    # Detalhe por arquivo vai para DEBUG; INFO recebe só o progresso periódico.
+    # Todas as chamadas de log usam argumentos %s (formatação preguiçosa), nunca f-strings.
+    info_enabled = log.isEnabledFor(logging.INFO)
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+    progress = itertools.count(1)  # next() é atômico sob o GIL
+
+    def copy_one(path: str, src_size: int, src_mtime: int) -> int | None:
+        rel = path[prefix_len:]
+        target = mk_target(dest_prefix, rel)
+
+        if check_target and _is_unchanged(target, src_size, src_mtime):
+            if debug_enabled:
+                log.debug("Arquivo inalterado, ignorado: %s", path)
+            return None
+
+        if link_prefix is not None:
+            previous = f"{link_prefix}{rel}"
+            if _is_unchanged(previous, src_size, src_mtime):
+                _link_file(previous, target)
+                if debug_enabled:
+                    log.debug("Arquivo inalterado, link para backup anterior: %s -> %s", previous, target)
+                return None
+
+        # Copia via sendfile/reflink (metadata com copystat) ou cria link físico
+        size = transfer(path, target, src_size)
+        if debug_enabled:
+            log.debug("Arquivo copiado: %s -> %s (%d bytes)", path, target, size)
+        if info_enabled:
+            done = next(progress)
+            if done % PROGRESS_LOG_EVERY == 0:
+                log.log(logging.INFO, "Progresso: %d arquivos copiados", done)
+        return size
+
+    def make_dir(path: str) -> None:
+        # O pai sempre já existe (criado antes na travessia): um mkdir basta
+        try:
+            os.mkdir(f"{dest_prefix}{path[prefix_len:]}")
+        except FileExistsError:
+            pass
+
+    # Caminha recursivamente, gerando (origem, tamanho, mtime). A estrutura de
+    # diretórios é replicada pela própria travessia, antes de os arquivos de cada
+    # diretório chegarem às threads de cópia, que nunca chamam mkdir.
+    files_iter = _walk_files(src_str, on_dir=make_dir)
+
+    if workers == 1:
+        files_copied = 0
+        bytes_copied = 0
+        files_unchanged = 0
+        for path, src_size, src_mtime in files_iter:
+            if copy_one(path, src_size, src_mtime) is None:
+                files_unchanged += 1
+            else:
+                # Mesma definição do caminho paralelo: tamanho visto na travessia
+                bytes_copied += src_size
+                files_copied += 1
+    else:
+        # Travessia e cópias acontecem ao mesmo tempo; pequenos e grandes em filas separadas
+        small_workers, large_workers = _split_workers(workers)
+        lanes = (
+            _Lane("small", small_workers, SMALL_FILE_BATCH_SIZE),
+            _Lane("large", large_workers),
+        )
+        files_copied, bytes_copied, files_unchanged = _copy_pipeline(
+            files_iter,
+            copy_one,
+            lanes,
+            route=lambda size: 1 if size >= large_file_threshold else 0,
+        )
 
     log.info(
-        "Backup finalizado com sucesso. Arquivos: %d | Bytes: %d | Destino: %s",
+        "Backup finalizado com sucesso. Arquivos: %d | Inalterados: %d | Bytes: %d | Destino: %s",
         files_copied,
+        files_unchanged,
         bytes_copied,
         dest_root,
     )
+    # Handlers com buffer (ver app.logger) gravam aqui, uma vez por backup
+    for handler in log.handlers:
+        handler.flush()
 
     return BackupResult(
         files_copied=files_copied,
         bytes_copied=bytes_copied,
         destination_used=dest_root,
         timestamp_str=ts,
+        files_unchanged=files_unchanged,
     )
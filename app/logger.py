@@ -5,15 +5,121 @@ Configuração de logging para o projeto de backup.
 
 - Logs no console e em arquivo (backup.log por padrão).
 - Níveis: INFO para operações normais e ERROR para falhas.
+- O arquivo é gravado em lotes (BufferedRotatingFileHandler) para reduzir
+  write()/flush() por registro; WARNING ou superior força a gravação imediata
+  e nenhum registro fica mais de ~1s só na memória.
+- O asctime é formatado uma vez por segundo (CachedTimeFormatter).
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter que reaproveita o asctime de registros do mesmo segundo.
+
+    Com um datefmt sem frações de segundo, todos os registros de um mesmo
+    segundo têm o mesmo asctime; o strftime só roda quando o segundo muda.
+    Sem datefmt (formato padrão, com milissegundos) não há cache.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # (segundo, texto) numa única tupla: troca atômica entre threads
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached_text)
+        return cached_text
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler que acumula registros em memória e grava em lote.
+
+    Grava quando acumula buffer_records registros, ao receber um registro de
+    nível WARNING ou superior, flush_interval segundos após o primeiro registro
+    pendente (timer em thread daemon, para `tail -f` e para não perder o log
+    inteiro se o processo for morto), em flush() explícito e no close().
+    """
+
+    def __init__(
+        self,
+        *args,
+        buffer_records: int = 512,
+        flush_interval: float = 1.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buffer_records = buffer_records
+        self.flush_interval = flush_interval
+        self._pending: list[str] = []
+        self._last_record: logging.LogRecord | None = None
+        self._timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Chamado com o lock do handler já adquirido (Handler.handle)
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        self._last_record = record
+        if len(self._pending) >= self.buffer_records or record.levelno >= logging.WARNING:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            # Falhas de escrita/rotação (disco cheio, pipe fechado...) vão para
+            # handleError, como no emit() padrão, e nunca para quem loga/faz flush
+            try:
+                if self._pending:
+                    self._write_pending()
+                super().flush()
+            except Exception:
+                # Mantém o lote para a próxima tentativa, limitado a buffer_records
+                del self._pending[:-self.buffer_records]
+                if self._last_record is not None:
+                    self.handleError(self._last_record)
+        finally:
+            self.release()
+
+    def _write_pending(self) -> None:
+        data = "".join(self._pending)
+        if self.stream is None:
+            self.stream = self._open()
+        # Checagem de rotação uma vez por lote, não por registro; como o
+        # shouldRollover do Python 3.12, não se aplica a arquivos não regulares
+        # (ex.: /dev/stdout, pipes), que não suportam tell()
+        if self.maxBytes > 0 and os.path.isfile(self.baseFilename):
+            pos = self.stream.tell()
+            if pos and pos + len(data) >= self.maxBytes:
+                self.doRollover()
+        self.stream.write(data)
+        # Só descarta o lote depois de gravado
+        self._pending.clear()
+
+
 def get_logger(
     name: str = "backup_tool",
     log_file: str | Path = "backup.log",
@@ -40,7 +146,7 @@ def get_logger(
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    fmt = logging.Formatter(
+    fmt = CachedTimeFormatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -50,10 +156,10 @@ def get_logger(
     ch.setLevel(level)
     ch.setFormatter(fmt)
 
-    # Arquivo com rotação
-    fh = RotatingFileHandler(
+    # Arquivo com rotação (gravação em lote)
+    fh = BufferedRotatingFileHandler(
         filename=str(log_path),
-        maxBytes=1_000_000,   # 1MB
+        maxBytes=10_000_000,  # 10MB
         backupCount=3,
         encoding="utf-8",
     )
@@ -7,15 +7,18 @@ Exemplos:
   python -m app.main --source ./origem --dest ./backups --versioning folder
   python -m app.main --source ./origem --dest ./backups --versioning filename
   python -m app.main --source ./origem --dest ./backups --simulate-missing-source
+  python -m app.main --source ./origem --dest ./backups --jobs 8
+  python -m app.main --source ./origem --dest ./backups --copy-mode reflink
 """
 
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 
-from app.backup import run_backup
+from app.backup import LARGE_FILE_THRESHOLD, run_backup
 from app.logger import get_logger
 
 
@@ -34,6 +37,40 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default="backup.log",
         help="Arquivo de log (default: backup.log)",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Loga cada arquivo copiado (nível DEBUG)",
+    )
+    parser.add_argument(
+        "--copy-mode",
+        choices=["copy", "reflink", "hardlink"],
+        default="copy",
+        help="Modo de cópia: copy | reflink | hardlink (os dois últimos exigem mesmo sistema de arquivos)",
+    )
+    parser.add_argument(
+        "--no-skip-unchanged",
+        action="store_true",
+        help="Com --versioning none, copia todos os arquivos mesmo que o destino já esteja igual",
+    )
+    parser.add_argument(
+        "--link-unchanged",
+        metavar="BACKUP_ANTERIOR",
+        default=None,
+        help="Com --versioning folder, cria links físicos para arquivos inalterados desse backup anterior",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Threads de cópia em paralelo (default: 1; 0 = automático)",
+    )
+    parser.add_argument(
+        "--large-file-threshold",
+        type=int,
+        default=LARGE_FILE_THRESHOLD,
+        help="Tamanho em bytes a partir do qual o arquivo vai para a fila de grandes (default: 1 MiB)",
+    )
 
     # Simulações/erros
     parser.add_argument(
@@ -54,7 +91,10 @@ def main(argv: list[str] | None = None) -> int:
     argv = argv if argv is not None else sys.argv[1:]
     args = parse_args(argv)
 
-    logger = get_logger(log_file=args.log_file)
+    logger = get_logger(
+        log_file=args.log_file,
+        level=logging.DEBUG if args.verbose else logging.INFO,
+    )
 
     source = Path(args.source)
     dest = Path(args.dest)
@@ -69,6 +109,11 @@ def main(argv: list[str] | None = None) -> int:
             versioning=args.versioning,
             create_destination=not args.no_create_dest,
             logger=logger,
+            jobs=args.jobs,
+            large_file_threshold=args.large_file_threshold,
+            copy_mode=args.copy_mode,
+            skip_unchanged=not args.no_skip_unchanged,
+            link_unchanged=args.link_unchanged,
         )
         return 0
     except Exception as exc:
@@ -1,11 +1,15 @@
 # tests/test_backup.py
 from __future__ import annotations
 
+import errno
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+from app import backup
 from app.backup import run_backup
 
 
@@ -81,3 +85,304 @@ def test_backup_no_create_dest_fails(tmp_path: Path):
             versioning="none",
             create_destination=False,
         )
+
+
+def test_backup_bytes_and_metadata_preserved(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+
+    content = "x" * (3 * 1024 * 1024 + 7)  # maior que um bloco do sendfile
+    write_file(src / "big.bin", content)
+    os.utime(src / "big.bin", (1_700_000_000, 1_700_000_000))
+
+    result = run_backup(source_dir=src, destination_dir=dest, versioning="none")
+
+    copied = dest / "big.bin"
+    assert copied.read_text(encoding="utf-8") == content
+    assert result.bytes_copied == len(content)
+    assert int(copied.stat().st_mtime) == 1_700_000_000
+
+
+def test_backup_sendfile_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+
+    def no_sendfile(*args, **kwargs):
+        raise OSError(errno.ENOSYS, "sendfile indisponível")
+
+    monkeypatch.setattr(os, "sendfile", no_sendfile)
+
+    result = run_backup(source_dir=src, destination_dir=dest, versioning="none")
+
+    assert (dest / "a.txt").read_text(encoding="utf-8") == "hello"
+    assert result.bytes_copied == 5
+
+
+def test_backup_parallel_jobs(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+
+    for i in range(20):
+        write_file(src / f"d{i % 3}" / f"f{i}.txt", f"conteudo {i}")
+
+    result = run_backup(source_dir=src, destination_dir=dest, versioning="none", jobs=4)
+
+    assert result.files_copied == 20
+    assert result.bytes_copied == sum(len(f"conteudo {i}") for i in range(20))
+    for i in range(20):
+        assert (dest / f"d{i % 3}" / f"f{i}.txt").read_text(encoding="utf-8") == f"conteudo {i}"
+
+
+def test_backup_invalid_jobs_raises(tmp_path: Path):
+    src = tmp_path / "src"
+    write_file(src / "a.txt", "x")
+    with pytest.raises(ValueError):
+        run_backup(source_dir=src, destination_dir=tmp_path / "dest", jobs=-1)
+
+
+def test_backup_parallel_copy_error_propagates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    for i in range(50):
+        write_file(src / f"f{i}.txt", "x")
+
+    real_copystat = shutil.copystat
+
+    # Falha via shutil (e não em app.backup) para valer também com o módulo compilado
+    def flaky_copystat(src_path, dst_path, *args, **kwargs):
+        if os.fspath(src_path).endswith("f7.txt"):
+            raise PermissionError(f"sem permissão: {src_path}")
+        return real_copystat(src_path, dst_path, *args, **kwargs)
+
+    monkeypatch.setattr(shutil, "copystat", flaky_copystat)
+
+    with pytest.raises(PermissionError):
+        run_backup(source_dir=src, destination_dir=dest, versioning="none", jobs=4)
+
+
+def test_backup_parallel_small_and_large_files(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+
+    for i in range(100):
+        write_file(src / "small" / f"s{i}.txt", "p" * i)
+    write_file(src / "large" / "big.bin", "G" * 5000)
+
+    result = run_backup(
+        source_dir=src,
+        destination_dir=dest,
+        versioning="none",
+        jobs=5,
+        large_file_threshold=1000,
+    )
+
+    assert result.files_copied == 101
+    assert result.bytes_copied == sum(range(100)) + 5000
+    assert (dest / "large" / "big.bin").read_text(encoding="utf-8") == "G" * 5000
+    assert (dest / "small" / "s99.txt").read_text(encoding="utf-8") == "p" * 99
+
+
+def test_backup_hardlink_mode(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "sub" / "a.txt", "hello")
+
+    result = run_backup(source_dir=src, destination_dir=dest, versioning="none", copy_mode="hardlink")
+
+    assert (dest / "sub" / "a.txt").stat().st_ino == (src / "sub" / "a.txt").stat().st_ino
+    assert result.bytes_copied == 5
+
+
+def test_backup_reflink_mode_copies_content(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+
+    # Sem suporte a reflink no sistema de arquivos, cai para cópia normal
+    result = run_backup(source_dir=src, destination_dir=dest, versioning="none", copy_mode="reflink")
+
+    assert (dest / "a.txt").read_text(encoding="utf-8") == "hello"
+    assert result.bytes_copied == 5
+
+
+def test_backup_incremental_skips_unchanged(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+    write_file(src / "sub" / "b.txt", "world")
+
+    first = run_backup(source_dir=src, destination_dir=dest, versioning="none")
+    assert first.files_copied == 2
+
+    write_file(src / "sub" / "b.txt", "mundo!")
+    second = run_backup(source_dir=src, destination_dir=dest, versioning="none")
+
+    assert second.files_copied == 1
+    assert second.files_unchanged == 1
+    assert second.bytes_copied == len("mundo!")
+    assert (dest / "sub" / "b.txt").read_text(encoding="utf-8") == "mundo!"
+
+
+def test_backup_link_unchanged_from_previous_folder(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+    write_file(src / "b.txt", "world")
+
+    first = run_backup(
+        source_dir=src,
+        destination_dir=dest,
+        versioning="folder",
+        now_fn=lambda: datetime(2025, 12, 26, 10, 0, 0),
+    )
+
+    write_file(src / "b.txt", "mundo!")
+    second = run_backup(
+        source_dir=src,
+        destination_dir=dest,
+        versioning="folder",
+        now_fn=lambda: datetime(2025, 12, 27, 10, 0, 0),
+        link_unchanged=first.destination_used,
+    )
+
+    assert second.files_copied == 1
+    assert second.files_unchanged == 1
+    old_a = first.destination_used / "a.txt"
+    new_a = second.destination_used / "a.txt"
+    assert new_a.stat().st_ino == old_a.stat().st_ino
+    assert (second.destination_used / "b.txt").read_text(encoding="utf-8") == "mundo!"
+
+
+@pytest.mark.parametrize(
+    ("root", "child", "rel"),
+    [
+        ("/", "/etc", "etc"),
+        ("/srv/dados", "/srv/dados/a/b.txt", "a/b.txt"),
+        ("/srv/dados/", "/srv/dados/a/b.txt", "a/b.txt"),
+    ],
+)
+def test_prefix_len_slices_relative_path(root: str, child: str, rel: str):
+    assert child[backup._prefix_len(root):] == rel
+
+
+def test_backup_replicates_directory_structure(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a" / "b" / "c.txt", "x")
+    (src / "vazio" / "interno").mkdir(parents=True)
+
+    run_backup(source_dir=src, destination_dir=dest, versioning="none", jobs=3)
+
+    assert (dest / "a" / "b" / "c.txt").exists()
+    assert (dest / "vazio" / "interno").is_dir()
+
+
+def test_backup_same_source_and_destination_raises(tmp_path: Path):
+    src = tmp_path / "src"
+    write_file(src / "a.txt", "hello")
+
+    with pytest.raises(shutil.SameFileError):
+        run_backup(source_dir=src, destination_dir=src, versioning="none", skip_unchanged=False)
+
+    assert (src / "a.txt").read_text(encoding="utf-8") == "hello"
+
+
+def test_backup_hardlink_same_source_and_destination_raises(tmp_path: Path):
+    src = tmp_path / "src"
+    write_file(src / "a.txt", "hello")
+
+    with pytest.raises(shutil.SameFileError):
+        run_backup(
+            source_dir=src,
+            destination_dir=src,
+            versioning="none",
+            copy_mode="hardlink",
+            skip_unchanged=False,
+        )
+
+    assert (src / "a.txt").read_text(encoding="utf-8") == "hello"
+
+
+def test_backup_hardlink_rerun_keeps_existing_link(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+
+    for _ in range(2):
+        run_backup(
+            source_dir=src,
+            destination_dir=dest,
+            versioning="none",
+            copy_mode="hardlink",
+            skip_unchanged=False,
+        )
+
+    assert (dest / "a.txt").stat().st_ino == (src / "a.txt").stat().st_ino
+    assert (src / "a.txt").read_text(encoding="utf-8") == "hello"
+
+
+def test_backup_copy_over_previous_hardlink_keeps_source(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+
+    for mode in ("copy", "reflink"):
+        run_backup(source_dir=src, destination_dir=dest, versioning="none", copy_mode="hardlink")
+        run_backup(
+            source_dir=src,
+            destination_dir=dest,
+            versioning="none",
+            copy_mode=mode,
+            skip_unchanged=False,
+        )
+
+        assert (src / "a.txt").read_text(encoding="utf-8") == "hello"
+        assert (dest / "a.txt").read_text(encoding="utf-8") == "hello"
+        assert (dest / "a.txt").stat().st_ino != (src / "a.txt").stat().st_ino
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_backup_bytes_are_walk_sizes_for_any_jobs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int
+):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+
+    real_sendfile = os.sendfile
+    grown = []
+
+    # Simula o arquivo crescendo entre a travessia e a cópia
+    def growing_sendfile(*args):
+        if not grown:
+            grown.append(True)
+            with open(src / "a.txt", "a", encoding="utf-8") as fh:
+                fh.write("!!!")
+        return real_sendfile(*args)
+
+    monkeypatch.setattr(os, "sendfile", growing_sendfile)
+
+    result = run_backup(source_dir=src, destination_dir=dest, versioning="none", jobs=jobs)
+
+    assert result.bytes_copied == 5
+
+
+def test_backup_link_unchanged_same_as_destination_keeps_files(tmp_path: Path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    write_file(src / "a.txt", "hello")
+    fixed_now = datetime(2025, 12, 26, 10, 0, 0)
+
+    first = run_backup(source_dir=src, destination_dir=dest, versioning="folder", now_fn=lambda: fixed_now)
+    # Mesmo segundo: o "backup anterior" é a própria pasta de destino
+    second = run_backup(
+        source_dir=src,
+        destination_dir=dest,
+        versioning="folder",
+        now_fn=lambda: fixed_now,
+        link_unchanged=first.destination_used,
+    )
+
+    assert second.files_copied == 1
+    assert (second.destination_used / "a.txt").read_text(encoding="utf-8") == "hello"
@@ -1,9 +1,16 @@
 # tests/test_logger.py
 from __future__ import annotations
 
+import errno
+import logging
+import os
+import time
 from pathlib import Path
 
-from app.logger import get_logger
+import pytest
+
+from app import backup
+from app.logger import BufferedRotatingFileHandler, CachedTimeFormatter, get_logger
 from app.backup import run_backup
 
 
@@ -21,10 +28,49 @@ def test_logger_writes_to_file(tmp_path: Path):
 
     assert log_file.exists()
     content = log_file.read_text(encoding="utf-8")
-    assert "Arquivo copiado" in content
+    # Detalhe por arquivo só no nível DEBUG
+    assert "Arquivo copiado" not in content
     assert "Backup finalizado com sucesso" in content
 
 
+def test_logger_debug_logs_each_file(tmp_path: Path):
+    log_file = tmp_path / "backup.log"
+    logger = get_logger(name="test_logger_debug", log_file=log_file, level=logging.DEBUG)
+
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+
+    src.mkdir()
+    (src / "a.txt").write_text("hello", encoding="utf-8")
+
+    run_backup(source_dir=src, destination_dir=dest, versioning="none", logger=logger)
+
+    content = log_file.read_text(encoding="utf-8")
+    assert "Arquivo copiado" in content
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_logger_progress_every_n_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int):
+    monkeypatch.setattr(backup, "PROGRESS_LOG_EVERY", 2)
+    log_file = tmp_path / "backup.log"
+    logger = get_logger(name=f"test_logger_progress_{jobs}", log_file=log_file)
+
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+
+    src.mkdir()
+    for i in range(5):
+        (src / f"f{i}.txt").write_text("x", encoding="utf-8")
+
+    run_backup(source_dir=src, destination_dir=dest, versioning="none", logger=logger, jobs=jobs)
+
+    progress = [line for line in log_file.read_text(encoding="utf-8").splitlines() if "Progresso:" in line]
+    assert [line.split("Progresso: ")[1] for line in progress] == [
+        "2 arquivos copiados",
+        "4 arquivos copiados",
+    ]
+
+
 def test_logger_error_on_missing_source(tmp_path: Path):
     log_file = tmp_path / "backup.log"
     logger = get_logger(name="test_logger_error", log_file=log_file)
@@ -39,3 +85,105 @@ def test_logger_error_on_missing_source(tmp_path: Path):
 
     content = log_file.read_text(encoding="utf-8")
     assert "Diretório de origem não existe" in content
+
+
+def test_buffered_handler_writes_in_batches(tmp_path: Path):
+    log_file = tmp_path / "buffered.log"
+    handler = BufferedRotatingFileHandler(filename=str(log_file), encoding="utf-8", buffer_records=3)
+    logger = logging.getLogger("test_logger_buffered")
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    try:
+        logger.info("um")
+        logger.info("dois")
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        logger.info("tres")
+        assert log_file.read_text(encoding="utf-8").splitlines() == ["um", "dois", "tres"]
+
+        logger.warning("aviso")
+        assert log_file.read_text(encoding="utf-8").splitlines()[-1] == "aviso"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_cached_time_formatter_reuses_same_second():
+    fmt = CachedTimeFormatter(fmt="%(asctime)s", datefmt="%Y-%m-%d %H:%M:%S")
+    record = logging.makeLogRecord({"msg": "x"})
+
+    record.created = 1_700_000_000.1
+    first = fmt.formatTime(record, fmt.datefmt)
+    record.created = 1_700_000_000.9
+    assert fmt.formatTime(record, fmt.datefmt) == first
+
+    record.created = 1_700_000_001.0
+    assert fmt.formatTime(record, fmt.datefmt) != first
+
+
+def test_buffered_handler_flushes_on_timer(tmp_path: Path):
+    log_file = tmp_path / "timer.log"
+    handler = BufferedRotatingFileHandler(filename=str(log_file), encoding="utf-8", flush_interval=0.05)
+    logger = logging.getLogger("test_logger_timer")
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    try:
+        logger.info("pendente")
+        deadline = time.monotonic() + 5
+        while log_file.read_text(encoding="utf-8") == "" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log_file.read_text(encoding="utf-8").splitlines() == ["pendente"]
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_buffered_handler_writes_to_pipe():
+    read_fd, write_fd = os.pipe()
+    handler = BufferedRotatingFileHandler(
+        filename=f"/dev/fd/{write_fd}", maxBytes=1_000_000, encoding="utf-8"
+    )
+    logger = logging.getLogger("test_logger_pipe")
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    try:
+        logger.info("via pipe")
+        handler.flush()  # pipe não suporta tell(): não pode levantar exceção
+        assert os.read(read_fd, 1024).decode("utf-8") == "via pipe\n"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_buffered_handler_write_error_goes_to_handle_error(tmp_path: Path, monkeypatch):
+    handler = BufferedRotatingFileHandler(filename=str(tmp_path / "erro.log"), encoding="utf-8")
+    handled: list[logging.LogRecord] = []
+    monkeypatch.setattr(handler, "handleError", handled.append)
+    logger = logging.getLogger("test_logger_write_error")
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    def disk_full(data: str) -> int:
+        raise OSError(errno.ENOSPC, "sem espaço")
+
+    try:
+        logger.info("registro")
+        monkeypatch.setattr(handler.stream, "write", disk_full)
+        handler.flush()  # não propaga
+
+        assert len(handled) == 1
+        monkeypatch.undo()
+        handler.flush()
+        assert (tmp_path / "erro.log").read_text(encoding="utf-8") == "registro\n"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()